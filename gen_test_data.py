@@ -8,64 +8,66 @@ Creates 6 files in ./test-data/:
   concurrent-A.csv / concurrent-B.csv  — ~99% overlap (fully concurrent)
 
 Each file has 2000 operations (GET + PUT) spread across the time window.
+Requires NumPy, from the package's dev extra: pip install -e "python[dev]"
 """
 
-import csv
-import datetime
-import math
 import os
-import random
 
-random.seed(42)
+import numpy as np
+import polars as pl
+
+rng = np.random.default_rng(42)
 os.makedirs("test-data", exist_ok=True)
 
-EPOCH = datetime.datetime(2026, 1, 1, 10, 0, 0, tzinfo=datetime.timezone.utc)
-BYTES_SIZES = [0, 4096, 65536, 1048576, 16777216]   # zero, 4K, 64K, 1M, 16M
-OPS         = ["GET", "GET", "GET", "PUT", "LIST"]   # weighted toward GET
-ENDPOINTS   = ["http://node1:9000", "http://node2:9000"]
-THREADS     = list(range(1, 9))
+EPOCH_NS    = 1_767_261_600 * 1_000_000_000          # 2026-01-01T10:00:00Z
+BYTES_SIZES = np.array([0, 4096, 65536, 1048576, 16777216])   # zero, 4K, 64K, 1M, 16M
+OPS         = np.array(["GET", "GET", "GET", "PUT", "LIST"])   # weighted toward GET
+ENDPOINTS   = np.array(["http://node1:9000", "http://node2:9000"])
 N_OPS       = 2000
 
 
-def ts(dt: datetime.datetime) -> str:
-    return dt.strftime("%Y-%m-%dT%H:%M:%S.%f000Z")
+OPLOG_COLUMNS = ["idx", "thread", "op", "client_id", "n_objects", "bytes",
+                 "endpoint", "file", "error", "start", "first_byte", "end", "duration_ns",
+                 "start_ns", "end_ns"]
+
+TS_FORMAT = "%Y-%m-%dT%H:%M:%S%.9fZ"
 
 
 def gen_file(path: str, window_start_s: float, window_end_s: float) -> None:
     """Generate an oplog TSV file with N_OPS operations spread over [window_start_s, window_end_s]."""
     span = window_end_s - window_start_s
-    rows = []
-    for idx in range(N_OPS):
-        op        = random.choice(OPS)
-        thread    = random.choice(THREADS)
-        client_id = f"client{random.randint(1, 2)}"
-        nbytes    = 0 if op == "LIST" else random.choice(BYTES_SIZES[1:])
-        endpoint  = random.choice(ENDPOINTS)
-        # Spread start times uniformly across the window
-        op_start_s = window_start_s + (idx / N_OPS) * span + random.uniform(0, span / N_OPS)
-        # Latency: log-normal around 5ms for small ops, 50ms for large
-        base_lat_s = 0.005 if nbytes < 1_000_000 else 0.050
-        lat_s = max(0.0001, random.lognormvariate(math.log(base_lat_s), 0.5))
-        op_end_s   = op_start_s + lat_s
-        first_byte_s = op_start_s + lat_s * 0.1
-        dur_ns     = int(lat_s * 1e9)
-
-        start_dt = EPOCH + datetime.timedelta(seconds=op_start_s)
-        end_dt   = EPOCH + datetime.timedelta(seconds=op_end_s)
-        fb_dt    = EPOCH + datetime.timedelta(seconds=first_byte_s)
-
-        rows.append([
-            idx, thread, op, client_id, 1, nbytes,
-            endpoint, f"obj-{idx:06d}", "",
-            ts(start_dt), ts(fb_dt), ts(end_dt), dur_ns,
-        ])
-
-    with open(path, "w", newline="") as f:
-        w = csv.writer(f, delimiter="\t")
-        w.writerow(["idx", "thread", "op", "client_id", "n_objects", "bytes",
-                    "endpoint", "file", "error", "start", "first_byte", "end", "duration_ns"])
-        w.writerows(rows)
-    print(f"Wrote {len(rows)} ops  →  {path}  (window {window_start_s:.0f}s – {window_end_s:.0f}s)")
+    idx = np.arange(N_OPS)
+    ops     = rng.choice(OPS, N_OPS)
+    threads = rng.integers(1, 9, N_OPS)
+    clients = rng.integers(1, 3, N_OPS)
+    nbytes  = np.where(ops == "LIST", 0, rng.choice(BYTES_SIZES[1:], N_OPS))
+    endpoints = rng.choice(ENDPOINTS, N_OPS)
+    # Spread start times uniformly across the window
+    op_start_s = window_start_s + (idx / N_OPS) * span + rng.uniform(0, span / N_OPS, N_OPS)
+    # Latency: log-normal around 5ms for small ops, 50ms for large
+    base_lat_s = np.where(nbytes < 1_000_000, 0.005, 0.050)
+    lat_s = np.maximum(0.0001, rng.lognormal(np.log(base_lat_s), 0.5))
+    start_ns = EPOCH_NS + (op_start_s * 1e9).astype(np.int64)
+    dur_ns   = (lat_s * 1e9).astype(np.int64)
+
+    df = pl.DataFrame({
+        "idx": idx, "thread": threads, "op": ops, "client_id": clients,
+        "n_objects": np.ones(N_OPS, dtype=np.int64), "bytes": nbytes,
+        "endpoint": endpoints, "start_ns": start_ns, "dur_ns": dur_ns,
+    }).with_columns(
+        pl.format("client{}", "client_id").alias("client_id"),
+        pl.format("obj-{}", pl.col("idx").cast(pl.Utf8).str.zfill(6)).alias("file"),
+        pl.lit(None, dtype=pl.Utf8).alias("error"),  # null is written as an empty field
+        pl.from_epoch("start_ns", time_unit="ns").alias("start"),
+        pl.from_epoch(pl.col("start_ns") + pl.col("dur_ns") // 10, time_unit="ns").alias("first_byte"),
+        pl.from_epoch(pl.col("start_ns") + pl.col("dur_ns"), time_unit="ns").alias("end"),
+        pl.col("dur_ns").alias("duration_ns"),
+        (pl.col("start_ns") + pl.col("dur_ns")).alias("end_ns"),
+    ).select(OPLOG_COLUMNS)
+
+    # One bulk write from Rust instead of a csv.writer call per row
+    df.write_csv(path, separator="\t", datetime_format=TS_FORMAT)
+    print(f"Wrote {N_OPS} ops  →  {path}  (window {window_start_s:.0f}s – {window_end_s:.0f}s)")
 
 
 # ── Scenario 1: Sequential ────────────────────────────────────────────────────
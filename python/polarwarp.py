@@ -26,23 +26,166 @@
 #
 ################################
 import polars as pl
-from datetime import datetime, timedelta
+from datetime import timedelta
+import argparse
+from collections import Counter
+import os
+from concurrent.futures import ThreadPoolExecutor
 import sys
-import re
+import stat
+import tempfile
+import threading
 import time
 
 # Metadata operations that should be grouped together (matching Rust implementation)
 META_OPS = ["LIST", "HEAD", "DELETE", "STAT"]
 
+# Summary category of each op (null for ops outside META/GET/PUT) and the bucket_# its
+# summary row is reported under.  load_oplog adds the category as a column once per file; it is an
+# Enum, so filtering or grouping on it compares a small integer instead of the op string.
+SUMMARY_CATEGORIES = {"META": 97, "GET": 98, "PUT": 99}
+OP_CATEGORY_EXPR = (
+    pl.when(pl.col("op").is_in(META_OPS)).then(pl.lit("META"))
+    .when(pl.col("op") == "GET").then(pl.lit("GET"))
+    .when(pl.col("op") == "PUT").then(pl.lit("PUT"))
+    .cast(pl.Enum(list(SUMMARY_CATEGORIES)))
+    .alias("category")
+)
+
+# Known oplog column types.  Passing these to the CSV reader (with inference disabled) skips the
+# schema-inference pre-scan; any other column in the file is read as a plain string.  op is a
+# Categorical rather than an Enum so op names outside the known set still load.
+OPLOG_SCHEMA = {
+    "idx": pl.UInt64,
+    "thread": pl.UInt32,
+    "op": pl.Categorical,
+    "client_id": pl.Categorical,
+    "n_objects": pl.UInt64,
+    "bytes": pl.UInt64,
+    "endpoint": pl.Categorical,
+    "duration_ns": pl.UInt64,
+    "start_ns": pl.Int64,
+    "end_ns": pl.Int64,
+}
+# Oplog columns any report reads; thread, client_id and endpoint are optional in the input
+REPORT_COLUMNS = ["start", "end", "op", "bytes", "duration_ns", "thread", "client_id", "endpoint"]
+
+# Columnar oplog exports are scanned directly; anything else is read as (optionally compressed) TSV
+COLUMNAR_SCANNERS = {".parquet": pl.scan_parquet, ".arrow": pl.scan_ipc, ".ipc": pl.scan_ipc, ".feather": pl.scan_ipc}
+
+# Oplog timestamp format.  "%#z" accepts a literal "Z" as well as "+00:00" style offsets, and parses
+# "Z" stamps as fast as a format with a hard-coded "Z", so every file uses the one format.
+TS_FORMAT = "%Y-%m-%dT%H:%M:%S%.f%#z"
+
+# Size bucket boundaries (matching sai3-bench)
+BUCKET_8K = 8 * 1024           # 8 KiB
+BUCKET_64K = 64 * 1024         # 64 KiB
+BUCKET_512K = 512 * 1024       # 512 KiB
+BUCKET_4M = 4 * 1024 * 1024    # 4 MiB
+BUCKET_32M = 32 * 1024 * 1024  # 32 MiB
+BUCKET_256M = 256 * 1024 * 1024  # 256 MiB
+BUCKET_2G = 2 * 1024 * 1024 * 1024  # 2 GiB
+
+# bucket_# is the number of lower bounds a row's size reaches: one branch-free compare per bound
+# instead of a when/then ladder.  Rows with unparseable bytes still land in the last bucket.
+# A search_sorted against the bounds measured no faster and maps null sizes to bucket 0.
+BUCKET_BOUNDS = [1, BUCKET_8K, BUCKET_64K, BUCKET_512K, BUCKET_4M, BUCKET_32M, BUCKET_256M, BUCKET_2G]
+BUCKET_NUM_EXPR = (
+    sum((pl.col("bytes") >= b).cast(pl.UInt8) for b in BUCKET_BOUNDS)
+    .fill_null(len(BUCKET_BOUNDS)).alias("bucket_#")
+)
+
+# Size bucket labels, indexed by bucket_# (matching sai3-bench/polarwarp-rs).  Rows only carry the
+# integer bucket_#, so group_by hashes one small int instead of a string; labels are attached per group.
+BUCKET_LABELS = ["zero", "1B-8KiB", "8KiB-64KiB", "64KiB-512KiB", "512KiB-4MiB", "4MiB-32MiB", "32MiB-256MiB", "256MiB-2GiB", ">2GiB"]
+BUCKET_LABEL_EXPR = pl.lit(pl.Series(BUCKET_LABELS)).gather(pl.col("bucket_#")).alias("bytes_bucket")
+
+# Latency columns (in microseconds) shared by every stats table.  Percentiles stay exact: each
+# quantile() is an O(n) selection within the group, which beats one shared sort per group, and
+# approximate sketches would drift from the Rust output.  The /1000 applies to each group's
+# aggregate, not to every row, so there is no per-row conversion to hoist.  The interpolation is
+# pinned to polars' "nearest" default so a library default change cannot move the reported values.
+LATENCY_AGG_EXPRS = [
+    (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
+    (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
+    (pl.col("duration_ns").quantile(0.90, interpolation="nearest") / 1000).alias("90%_lat_us"),
+    (pl.col("duration_ns").quantile(0.95, interpolation="nearest") / 1000).alias("95%_lat_us"),
+    (pl.col("duration_ns").quantile(0.99, interpolation="nearest") / 1000).alias("99%_lat_us"),
+]
+
+# Maximum latency and mean object size, shared by the full stats tables like the set above
+MAX_LAT_AGG_EXPR = (pl.col("duration_ns").max() / 1000).alias("max_lat_us")
+AVG_OBJ_AGG_EXPR = (pl.col("bytes").mean() / 1024).alias("avg_obj_KB")
+
+# The shorter latency set (mean, median, p99) printed in the per-op breakdown tables
+BREAKDOWN_LATENCY_AGG_EXPRS = [LATENCY_AGG_EXPRS[0], LATENCY_AGG_EXPRS[1], LATENCY_AGG_EXPRS[4]]
+
+# Column order of the per-file results tables, their Excel tabs and the summary rows (runtime_s
+# last).  Tables select the columns they carry in this order.
+RESULT_COLUMN_ORDER = [
+    "op", "bytes_bucket", "bucket_#", "mean_lat_us", "med._lat_us",
+    "90%_lat_us", "95%_lat_us", "99%_lat_us", "max_lat_us",
+    "avg_obj_KB", "ops_/_sec", "xput_MBps", "count", "max_threads", "runtime_s",
+]
+
+# Stats columns that format_table comma-formats in the per-file, per-client and per-endpoint tables;
+# format_table skips any a given table does not carry
+STATS_COMMA_COLUMNS = [
+    "mean_lat_us", "med._lat_us", "90%_lat_us", "95%_lat_us", "99%_lat_us",
+    "max_lat_us", "avg_obj_KB", "ops_/_sec", "xput_MBps", "count",
+]
+
+# Column order and comma-formatted columns of the consolidated results table
+CONSOLIDATED_COLUMN_ORDER = [
+    "op", "bytes_bucket", "bucket_#", "mean_lat_us", "med._lat_us",
+    "90%_lat_us", "95%_lat_us", "99%_lat_us", "avg_obj_KB",
+    "tot_ops_/_sec", "total_xput_MBps", "tot_count",
+]
+CONSOLIDATED_COMMA_COLUMNS = [
+    "mean_lat_us", "med._lat_us", "90%_lat_us", "95%_lat_us", "99%_lat_us",
+    "avg_obj_KB", "tot_ops_/_sec", "total_xput_MBps", "tot_count",
+]
+
+# Comma formatters for those columns; format_table binds one per column from its dtype
+_fmt_float = "{:,.2f}".format
+_fmt_int = "{:,}".format
+
 # Function to pretty up the output, by adding commas for readability, and using 4 digits for float
-def format_with_commas(value):
-    if isinstance(value, (int, float)):
-        if isinstance(value, float):
-            return f"{value:,.2f}"
-            #return f"{value:,.4f}"
+def _float_cells(values):
+    """Render floats like pandas' default display: six decimals, trailing zeros trimmed column-wide."""
+    cells = [None if v is None or v != v else f"{v:.6f}" for v in values]
+    # The column keeps as many decimals as its longest trimmed cell needs (at least one), so each
+    # cell is sliced once instead of trimming the whole column a character at a time
+    kept = [len(c.rstrip("0")) - c.index(".") - 1 for c in cells if c is not None]
+    trim = 6 - max(kept + [1])
+    return ["NaN" if c is None else c[:len(c) - trim] for c in cells]
+
+
+def format_table(df, columns_to_format=()):
+    """
+    Render a Polars DataFrame as right-aligned text columns, matching the layout of
+    pandas' to_string(index=False) so output stays comparable with earlier releases.
+    Columns listed in columns_to_format are comma-formatted with one formatter picked
+    per column from its dtype.  Tables hold one row per group, so building the text in
+    one string is cheap; machine-readable output goes through --output-dir instead.
+    """
+    text_cols = []
+    for series in df.get_columns():
+        values = series.to_list()
+        if series.name in columns_to_format and series.dtype.is_numeric():
+            fmt = _fmt_float if series.dtype.is_float() else _fmt_int
+            cells = ["NaN" if v is None else fmt(v) for v in values]
+            header = series.name   # comma-formatted columns are text, so no numeric header pad
         else:
-            return f"{value:,}"
-    return value  # Return the value unchanged if it's not numeric
+            if series.dtype.is_float():
+                cells = _float_cells(values)
+            else:
+                cells = ["NaN" if v is None else str(v) for v in values]
+            # Numeric columns get a leading space in the header, as pandas does
+            header = f" {series.name}" if series.dtype.is_numeric() else series.name
+        width = max([len(header)] + [len(c) for c in cells])
+        text_cols.append([header.rjust(width)] + [c.rjust(width) for c in cells])
+    return "\n".join(" ".join(row) for row in zip(*text_cols))
 
 
 def compute_per_client_stats(df, run_time_secs):
@@ -50,75 +193,47 @@ def compute_per_client_stats(df, run_time_secs):
     Compute statistics grouped by client_id to show variation across clients.
     Returns a DataFrame with per-client summary statistics.
     """
-    # Get unique clients
-    clients = df.select(pl.col("client_id").unique()).to_series().to_list()
+    # Overall stats for each client, plus one grouped pass over every (category, client) pair,
+    # collected as one batch.  The client count comes from the overall groups, not a separate scan.
+    client_stats, op_stats = pl.collect_all([
+        df.lazy().group_by(["client_id"]).agg([
+            *LATENCY_AGG_EXPRS,
+            MAX_LAT_AGG_EXPR,
+            AVG_OBJ_AGG_EXPR,
+            (pl.len() / run_time_secs).alias("ops_/_sec"),
+            ((pl.col("bytes").cast(pl.UInt64).sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
+            pl.len().alias("count"),
+        ]).sort("client_id"),
+        df.lazy().drop_nulls("category").group_by(["category", "client_id"]).agg([
+            *BREAKDOWN_LATENCY_AGG_EXPRS,
+            (pl.len() / run_time_secs).alias("ops_/_sec"),
+            ((pl.col("bytes").cast(pl.UInt64).sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
+            pl.len().alias("count"),
+        ]),
+    ])
     
-    if len(clients) <= 1:
+    if client_stats.height <= 1:
         print("\nOnly one client detected, skipping per-client statistics.")
         return None
     
     print(f"\n{'='*80}")
-    print(f"Per-Client Statistics ({len(clients)} clients detected)")
+    print(f"Per-Client Statistics ({client_stats.height} clients detected)")
     print(f"{'='*80}")
     
-    # Compute stats for each client
-    client_stats = df.group_by(["client_id"]).agg([
-        (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-        (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-        (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-        (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-        (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-        (pl.col("duration_ns").max() / 1000).alias("max_lat_us"),
-        (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-        (pl.count("op") / run_time_secs).alias("ops_/_sec"),
-        ((pl.col("bytes").sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
-        pl.count("op").alias("count"),
-    ]).sort("client_id")
-    
-    # Convert to pandas for pretty printing
-    client_stats_pd = client_stats.to_pandas()
-    
-    columns_to_format = [
-        "mean_lat_us", "med._lat_us", "90%_lat_us", "95%_lat_us", "99%_lat_us", 
-        "max_lat_us", "avg_obj_KB", "ops_/_sec", "xput_MBps", "count"
-    ]
-    
-    for column in columns_to_format:
-        if column in client_stats_pd:
-            client_stats_pd[column] = client_stats_pd[column].map(format_with_commas)
-    
-    print(client_stats_pd.to_string(index=False))
+    print(format_table(client_stats, STATS_COMMA_COLUMNS))
     
-    # Also compute per-client stats for each operation type
+    # Also print per-client stats for each operation type
     print(f"\nPer-Client Statistics by Operation Type:")
     print(f"{'-'*80}")
     
     for op_type in ["META", "GET", "PUT"]:
-        if op_type == "META":
-            op_df = df.filter(pl.col("op").is_in(META_OPS))
-        else:
-            op_df = df.filter(pl.col("op") == op_type)
+        op_client_stats = op_stats.filter(pl.col("category") == op_type).drop("category").sort("client_id")
         
-        if op_df.height == 0:
+        if op_client_stats.height == 0:
             continue
         
-        op_client_stats = op_df.group_by(["client_id"]).agg([
-            (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-            (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-            (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-            (pl.count("op") / run_time_secs).alias("ops_/_sec"),
-            ((pl.col("bytes").sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
-            pl.count("op").alias("count"),
-        ]).sort("client_id")
-        
-        op_client_stats_pd = op_client_stats.to_pandas()
-        
-        for column in ["mean_lat_us", "med._lat_us", "99%_lat_us", "ops_/_sec", "xput_MBps", "count"]:
-            if column in op_client_stats_pd:
-                op_client_stats_pd[column] = op_client_stats_pd[column].map(format_with_commas)
-        
         print(f"\n{op_type} Operations:")
-        print(op_client_stats_pd.to_string(index=False))
+        print(format_table(op_client_stats, STATS_COMMA_COLUMNS))
     
     print(f"\n{'='*80}\n")
     return client_stats
@@ -133,80 +248,79 @@ def compute_per_endpoint_stats(df, run_time_secs):
         print("\nendpoint column not found, skipping per-endpoint statistics.")
         return None
 
-    endpoints = df.select(
-        pl.col("endpoint").drop_nulls().unique()
-    ).to_series().to_list()
+    # Overall stats for each endpoint, plus one grouped pass over every (category, endpoint) pair,
+    # collected as one batch.  The overall table has one row per distinct endpoint, so its height
+    # is the endpoint count.
+    endpoint_stats, op_stats = pl.collect_all([
+        df.lazy().filter(pl.col("endpoint").is_not_null()).group_by(["endpoint"]).agg([
+            *LATENCY_AGG_EXPRS,
+            MAX_LAT_AGG_EXPR,
+            AVG_OBJ_AGG_EXPR,
+            (pl.len() / run_time_secs).alias("ops_/_sec"),
+            ((pl.col("bytes").cast(pl.UInt64).sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
+            pl.len().alias("count"),
+        ]).sort("endpoint"),
+        # Null endpoints keep their own group here, so a category is still listed when all of
+        # its rows lack an endpoint; they are dropped from the printed table below.
+        df.lazy().drop_nulls("category").group_by(["category", "endpoint"]).agg([
+            *BREAKDOWN_LATENCY_AGG_EXPRS,
+            (pl.len() / run_time_secs).alias("ops_/_sec"),
+            ((pl.col("bytes").cast(pl.UInt64).sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
+            pl.len().alias("count"),
+        ]),
+    ])
 
-    if len(endpoints) <= 1:
+    if endpoint_stats.height <= 1:
         print("\nOnly one endpoint detected, skipping per-endpoint statistics.")
         return None
 
     print(f"\n{'='*80}")
-    print(f"Per-Endpoint Statistics ({len(endpoints)} endpoints detected)")
+    print(f"Per-Endpoint Statistics ({endpoint_stats.height} endpoints detected)")
     print(f"{'='*80}")
 
-    endpoint_stats = df.group_by(["endpoint"]).agg([
-        (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-        (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-        (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-        (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-        (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-        (pl.col("duration_ns").max() / 1000).alias("max_lat_us"),
-        (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-        (pl.count("op") / run_time_secs).alias("ops_/_sec"),
-        ((pl.col("bytes").sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
-        pl.count("op").alias("count"),
-    ]).filter(
-        pl.col("endpoint").is_not_null() & (pl.col("count") > 0)
-    ).sort("endpoint")
-
-    endpoint_stats_pd = endpoint_stats.to_pandas()
-    columns_to_format = [
-        "mean_lat_us", "med._lat_us", "90%_lat_us", "95%_lat_us", "99%_lat_us",
-        "max_lat_us", "avg_obj_KB", "ops_/_sec", "xput_MBps", "count"
-    ]
-    for column in columns_to_format:
-        if column in endpoint_stats_pd:
-            endpoint_stats_pd[column] = endpoint_stats_pd[column].map(format_with_commas)
-
-    print(endpoint_stats_pd.to_string(index=False))
+    print(format_table(endpoint_stats, STATS_COMMA_COLUMNS))
 
     # Per-endpoint stats by op type
     print(f"\nPer-Endpoint Statistics by Operation Type:")
     print(f"{'-'*80}")
 
     for op_type in ["META", "GET", "PUT"]:
-        if op_type == "META":
-            op_df = df.filter(pl.col("op").is_in(META_OPS))
-        else:
-            op_df = df.filter(pl.col("op") == op_type)
+        op_ep_stats = op_stats.filter(pl.col("category") == op_type).drop("category")
 
-        if op_df.height == 0:
+        if op_ep_stats.height == 0:
             continue
 
-        op_ep_stats = op_df.group_by(["endpoint"]).agg([
-            (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-            (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-            (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-            (pl.count("op") / run_time_secs).alias("ops_/_sec"),
-            ((pl.col("bytes").sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
-            pl.count("op").alias("count"),
-        ]).filter(
-            pl.col("endpoint").is_not_null() & (pl.col("count") > 0)
-        ).sort("endpoint")
-
-        op_ep_stats_pd = op_ep_stats.to_pandas()
-        for column in ["mean_lat_us", "med._lat_us", "99%_lat_us", "ops_/_sec", "xput_MBps", "count"]:
-            if column in op_ep_stats_pd:
-                op_ep_stats_pd[column] = op_ep_stats_pd[column].map(format_with_commas)
+        op_ep_stats = op_ep_stats.filter(pl.col("endpoint").is_not_null()).sort("endpoint")
 
         print(f"\n{op_type} Operations:")
-        print(op_ep_stats_pd.to_string(index=False))
+        print(format_table(op_ep_stats, STATS_COMMA_COLUMNS))
 
     print(f"\n{'='*80}\n")
     return endpoint_stats
 
 
+def _unique_names(names, reserved=()):
+    """
+    Make per-file output names unique, for Excel tabs and Parquet files alike.  A name shared by
+    several files is numbered by occurrence (x-1, x-2, ...); any name that would still clash with
+    one already taken or with a reserved name gets the next free number.
+    """
+    tally = Counter(names)
+    taken = set(reserved)
+    seen = {}
+    unique = []
+    for name in names:
+        idx = seen.get(name, 0)
+        candidate = name if tally[name] == 1 else None
+        while candidate is None or candidate in taken:
+            idx += 1
+            candidate = f"{name}-{idx}"
+        seen[name] = idx
+        taken.add(candidate)
+        unique.append(candidate)
+    return unique
+
+
 # ─────────────────────────── Excel export ────────────────────────────────────
 
 def write_polarwarp_excel(excel_path, saved_files, per_client, per_endpoint,
@@ -215,7 +329,7 @@ def write_polarwarp_excel(excel_path, saved_files, per_client, per_endpoint,
 
     Args:
         excel_path:    Output .xlsx path.
-        saved_files:   List of dicts: {path, df (polars w/ buckets), run_secs}.
+        saved_files:   List of dicts: {path, df (polars LazyFrame w/ buckets), run_secs}.
         per_client:    Whether to write per-client detail tab.
         per_endpoint:  Whether to write per-endpoint detail tab.
         cons_df:       Consolidated polars DataFrame (multi-file only).
@@ -228,8 +342,6 @@ def write_polarwarp_excel(excel_path, saved_files, per_client, per_endpoint,
               file=sys.stderr)
         return
 
-    import pandas as pd
-
     single = len(saved_files) == 1
 
     # ── helpers ──────────────────────────────────────────────────────────────
@@ -247,230 +359,176 @@ def write_polarwarp_excel(excel_path, saved_files, per_client, per_endpoint,
         full = f"{base}-{suf}"
         return full if len(full) <= 31 else f"{base[:31-len(suf)-1]}-{suf}"
 
-    def _op_eff_times(df, run_secs):
-        """Return dict op_name → effective run time (seconds) for throughput."""
-        def _ot(fdf):
-            if fdf.height == 0:
-                return run_secs
-            mn = fdf.select(pl.col("start").min()).item()
-            mx = fdf.select(pl.col("end").max()).item()
-            if mn is None or mx is None:
-                return run_secs
-            dt = (mx - mn).total_seconds()
-            return dt if dt > 0.001 else run_secs
-        mt = _ot(df.filter(pl.col("op").is_in(META_OPS)))
-        gt = _ot(df.filter(pl.col("op") == "GET"))
-        pt = _ot(df.filter(pl.col("op") == "PUT"))
-        m = {op: mt for op in META_OPS}
-        m["GET"] = gt
-        m["PUT"] = pt
-        return m
-
-    def _main_pd(df, run_secs):
-        """Compute main bucketed stats as an unformatted pandas DataFrame."""
-        op_map = _op_eff_times(df, run_secs)
+    def _main_plan(lf, columns):
+        """Lazy bucketed aggregation behind the main results table."""
         agg = [
-            (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-            (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-            (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-            (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-            (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-            (pl.col("duration_ns").max() / 1000).alias("max_lat_us"),
-            (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-            pl.count("op").alias("count"),
-            pl.col("bytes").sum().cast(pl.Float64).alias("bytes_sum"),
+            *LATENCY_AGG_EXPRS,
+            MAX_LAT_AGG_EXPR,
+            AVG_OBJ_AGG_EXPR,
+            pl.len().alias("count"),
+            pl.col("bytes").cast(pl.UInt64).sum().cast(pl.Float64).alias("bytes_sum"),
         ]
-        if "thread" in df.columns:
-            agg.append(pl.col("thread").n_unique().alias("max_threads"))
-        result = df.group_by(["op", "bytes_bucket", "bucket_#"]).agg(agg)
-        result = result.with_columns(
-            pl.col("op").map_elements(
-                lambda op: op_map.get(op, run_secs), return_dtype=pl.Float64
-            ).alias("runtime_s")
+        if "thread" in columns:
+            agg.append(pl.col("thread").drop_nulls().n_unique().alias("max_threads"))
+        return lf.group_by(["op", "bucket_#"]).agg(agg).with_columns(BUCKET_LABEL_EXPR)
+
+    def _main_stats(grouped, summary, run_secs):
+        """Finish the main bucketed stats as an unformatted DataFrame."""
+        op_map = op_run_times(summary, run_secs)
+        # Per-op run times are looked up in the engine; ops without an entry use the full run time
+        result = grouped.with_columns(
+            pl.col("op").replace_strict(op_map, default=run_secs, return_dtype=pl.Float64).alias("runtime_s")
         ).with_columns([
             (pl.col("count").cast(pl.Float64) / pl.col("runtime_s")).alias("ops_/_sec"),
             (pl.col("bytes_sum") / (1024 * 1024) / pl.col("runtime_s")).alias("xput_MBps"),
         ]).drop(["bytes_sum"])
         result = result.filter(pl.col("count") > 0).sort(["bucket_#", "op"])
-        col_order = (["op", "bytes_bucket", "bucket_#"] +
-                     ["mean_lat_us", "med._lat_us", "90%_lat_us", "95%_lat_us",
-                      "99%_lat_us", "max_lat_us", "avg_obj_KB", "ops_/_sec",
-                      "xput_MBps", "count"] +
-                     (["max_threads"] if "max_threads" in result.columns else []) +
-                     ["runtime_s"])
-        return result.select([c for c in col_order if c in result.columns]).to_pandas()
-
-    def _client_pd(df, run_secs):
-        """Per-client overall stats (no printing)."""
-        if "client_id" not in df.columns:
-            return None
-        cs = df.group_by(["client_id"]).agg([
-            (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-            (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-            (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-            (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-            (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-            (pl.col("duration_ns").max() / 1000).alias("max_lat_us"),
-            (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-            (pl.count("op").cast(pl.Float64) / run_secs).alias("ops_/_sec"),
-            ((pl.col("bytes").sum().cast(pl.Float64) / (1024 * 1024)) / run_secs).alias("xput_MBps"),
-            pl.count("op").alias("count"),
+        present = set(result.columns)
+        return result.select([c for c in RESULT_COLUMN_ORDER if c in present])
+
+    def _client_plan(lf, run_secs):
+        """Lazy per-client overall stats."""
+        return lf.group_by(["client_id"]).agg([
+            *LATENCY_AGG_EXPRS,
+            MAX_LAT_AGG_EXPR,
+            AVG_OBJ_AGG_EXPR,
+            (pl.len().cast(pl.Float64) / run_secs).alias("ops_/_sec"),
+            ((pl.col("bytes").cast(pl.UInt64).sum().cast(pl.Float64) / (1024 * 1024)) / run_secs).alias("xput_MBps"),
+            pl.len().alias("count"),
         ]).sort("client_id")
-        return cs.to_pandas() if cs.height > 0 else None
-
-    def _endpoint_pd(df, run_secs):
-        """Per-endpoint overall stats (no printing)."""
-        if "endpoint" not in df.columns:
-            return None
-        es = (df.filter(pl.col("endpoint").is_not_null())
-                .group_by(["endpoint"])
-                .agg([
-                    (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-                    (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-                    (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-                    (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-                    (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-                    (pl.col("duration_ns").max() / 1000).alias("max_lat_us"),
-                    (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-                    (pl.count("op").cast(pl.Float64) / run_secs).alias("ops_/_sec"),
-                    ((pl.col("bytes").sum().cast(pl.Float64) / (1024 * 1024)) / run_secs).alias("xput_MBps"),
-                    pl.count("op").alias("count"),
-                ])
-                .filter(pl.col("count") > 0)
-                .sort("endpoint"))
-        return es.to_pandas() if es.height > 0 else None
-
-    def _endpoint_pd_for_op(df, run_secs, op_type):
-        """Per-endpoint stats for one op category (META/GET/PUT). Returns pandas df or None."""
-        if "endpoint" not in df.columns:
-            return None
-        if op_type == "META":
-            op_df = df.filter(pl.col("op").is_in(META_OPS))
-        else:
-            op_df = df.filter(pl.col("op") == op_type)
-        if op_df.height == 0:
-            return None
-        es = (op_df.filter(pl.col("endpoint").is_not_null())
-                   .group_by(["endpoint"])
-                   .agg([
-                       (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-                       (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-                       (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-                       (pl.count("op").cast(pl.Float64) / run_secs).alias("ops_/_sec"),
-                       ((pl.col("bytes").sum().cast(pl.Float64) / (1024 * 1024)) / run_secs).alias("xput_MBps"),
-                       pl.count("op").alias("count"),
-                   ])
-                   .filter(pl.col("count") > 0)
-                   .sort("endpoint"))
-        return es.to_pandas() if es.height > 0 else None
+
+    def _endpoint_plan(lf, run_secs):
+        """Lazy per-endpoint overall stats."""
+        return (lf.filter(pl.col("endpoint").is_not_null())
+                  .group_by(["endpoint"])
+                  .agg([
+                      *LATENCY_AGG_EXPRS,
+                      MAX_LAT_AGG_EXPR,
+                      AVG_OBJ_AGG_EXPR,
+                      (pl.len().cast(pl.Float64) / run_secs).alias("ops_/_sec"),
+                      ((pl.col("bytes").cast(pl.UInt64).sum().cast(pl.Float64) / (1024 * 1024)) / run_secs).alias("xput_MBps"),
+                      pl.len().alias("count"),
+                  ])
+                  .sort("endpoint"))
+
+    def _endpoint_by_op_plan(lf, run_secs):
+        """Lazy per-endpoint stats for every op category (META/GET/PUT), as one grouped pass."""
+        return (lf.filter(pl.col("endpoint").is_not_null())
+                  .drop_nulls("category")
+                  .group_by(["category", "endpoint"])
+                  .agg([
+                      *BREAKDOWN_LATENCY_AGG_EXPRS,
+                      (pl.len().cast(pl.Float64) / run_secs).alias("ops_/_sec"),
+                      ((pl.col("bytes").cast(pl.UInt64).sum().cast(pl.Float64) / (1024 * 1024)) / run_secs).alias("xput_MBps"),
+                      pl.len().alias("count"),
+                  ]))
+
+    def _report_stats(df, run_secs):
+        """Collect every table a file's Results and Detail tabs need in one collect_all batch,
+        so the engine runs the plans together over df.  Returns a dict of name -> DataFrame;
+        detail tables are present only when requested and df carries their column."""
+        lf = df.lazy()
+        columns = lf.collect_schema().names()
+        plans = {"main": _main_plan(lf, columns), "summary": summary_stats_plan(lf)}
+        if per_client and "client_id" in columns:
+            plans["client"] = _client_plan(lf, run_secs)
+        if per_endpoint and "endpoint" in columns:
+            plans["endpoint"] = _endpoint_plan(lf, run_secs)
+            plans["endpoint_by_op"] = _endpoint_by_op_plan(lf, run_secs)
+        return dict(zip(plans, pl.collect_all(list(plans.values()))))
 
     # ── build workbook ────────────────────────────────────────────────────────
     try:
-        wb = xlsxwriter.Workbook(excel_path, {'strings_to_urls': False})
+        wb = xlsxwriter.Workbook(excel_path, {'strings_to_urls': False, 'strings_to_formulas': False})
         bold_fmt   = wb.add_format({'bold': True, 'font_name': 'Aptos', 'font_size': 11})
         header_fmt = wb.add_format({'bold': True, 'font_name': 'Aptos'})
         data_fmt   = wb.add_format({'font_name': 'Aptos'})
+        # Numbers stay numeric in the sheet; Excel renders the thousands separators, as the console does
+        float_fmt  = wb.add_format({'font_name': 'Aptos', 'num_format': '#,##0.00'})
+        int_fmt    = wb.add_format({'font_name': 'Aptos', 'num_format': '#,##0'})
 
-        def _write_df(ws, df_pd, startrow):
-            """Write a pandas DataFrame to ws starting at startrow (0-based). Returns next free row."""
-            for ci, col_name in enumerate(df_pd.columns):
+        def _write_df(ws, df, startrow):
+            """Write a DataFrame to ws starting at startrow (0-based). Returns next free row."""
+            for ci, col_name in enumerate(df.columns):
                 ws.write(startrow, ci, col_name, header_fmt)
-            startrow += 1
-            for _, row in df_pd.iterrows():
-                for ci, val in enumerate(row):
-                    if isinstance(val, float) and val != val:  # NaN → blank
-                        ws.write(startrow, ci, '', data_fmt)
-                    elif isinstance(val, str):
-                        ws.write_string(startrow, ci, val.strip(), data_fmt)
-                    else:
-                        ws.write(startrow, ci, val, data_fmt)
-                startrow += 1
-            return startrow
-
-        def _write_data_rows(ws, df_pd, startrow):
+            return _write_data_rows(ws, df, startrow + 1)
+
+        def _write_data_rows(ws, df, startrow):
             """Write data rows only (no header). Returns next free row."""
-            for _, row in df_pd.iterrows():
-                for ci, val in enumerate(row):
-                    if isinstance(val, float) and val != val:
-                        ws.write(startrow, ci, '', data_fmt)
-                    elif isinstance(val, str):
-                        ws.write_string(startrow, ci, val.strip(), data_fmt)
-                    else:
-                        ws.write(startrow, ci, val, data_fmt)
-                startrow += 1
-            return startrow
+            # One write_column call per column, with that column's format picked once from its
+            # dtype: null/NaN cells come out blank and strings are stripped.
+            for ci, series in enumerate(df.get_columns()):
+                if series.dtype.is_float():
+                    series, fmt = series.fill_nan(None), float_fmt
+                elif series.dtype.is_integer():
+                    fmt = int_fmt
+                else:
+                    series, fmt = series.cast(pl.String).str.strip_chars(), data_fmt
+                ws.write_column(startrow, ci, series.to_list(), fmt)
+            return startrow + df.height
 
         def _write_label(ws, label, row):
             ws.write_string(row, 0, label, bold_fmt)
 
-        def _write_results_tab(ws, df, run_secs):
-            main_pd = _main_pd(df, run_secs)
-            nrow = _write_df(ws, main_pd, startrow=0)
-            summ = compute_summary_rows(df, run_secs)
-            if summ:
-                summ_pd = pd.DataFrame(summ)
+        def _write_results_tab(ws, df, run_secs, stats):
+            main_stats = _main_stats(stats["main"], stats["summary"], run_secs)
+            nrow = _write_df(ws, main_stats, startrow=0)
+            summ_df = compute_summary_rows(df, run_secs, stats=stats["summary"])
+            if summ_df is not None:
                 # Reorder columns to match the main results table above
-                ordered_cols = [c for c in main_pd.columns if c in summ_pd.columns]
-                summ_pd = summ_pd[ordered_cols]
-                _write_data_rows(ws, summ_pd, startrow=nrow)
+                summ_cols = set(summ_df.columns)
+                ordered_cols = [c for c in main_stats.columns if c in summ_cols]
+                _write_data_rows(ws, summ_df.select(ordered_cols), startrow=nrow)
 
-        def _write_detail_tab(ws, df, run_secs):
+        def _write_detail_tab(ws, stats):
             drow = 0
-            if per_client and "client_id" in df.columns:
+            if "client" in stats:
                 _write_label(ws, "=== Per-Client Statistics ===", drow)
                 drow += 1
-                cp = _client_pd(df, run_secs)
-                if cp is not None:
+                cp = stats["client"]
+                if cp.height > 0:
                     drow = _write_df(ws, cp, startrow=drow)
                     drow += 2
-            if per_endpoint and "endpoint" in df.columns:
+            if "endpoint" in stats:
                 _write_label(ws, "=== Per-Endpoint Statistics ===", drow)
                 drow += 1
-                ep = _endpoint_pd(df, run_secs)
-                if ep is not None:
+                ep = stats["endpoint"]
+                if ep.height > 0:
                     drow = _write_df(ws, ep, startrow=drow)
                 # Per-op breakdown: META, GET, PUT
-                for op_type in ["META", "GET", "PUT"]:
-                    op_ep = _endpoint_pd_for_op(df, run_secs, op_type)
-                    if op_ep is not None:
-                        drow += 1  # blank separator row
-                        _write_label(ws, f"--- {op_type} Operations ---", drow)
-                        drow += 1
-                        drow = _write_df(ws, op_ep, startrow=drow)
+                es = stats["endpoint_by_op"]
+                for op_type in SUMMARY_CATEGORIES:
+                    op_ep = es.filter(pl.col("category") == op_type).drop("category").sort("endpoint")
+                    if op_ep.height == 0:
+                        continue
+                    drow += 1  # blank separator row
+                    _write_label(ws, f"--- {op_type} Operations ---", drow)
+                    drow += 1
+                    drow = _write_df(ws, op_ep, startrow=drow)
 
         # Pre-compute unique short names to avoid worksheet name collisions when
         # multiple files share the same prefix after truncation to 20 characters.
         if single:
             unique_shorts = [None]
         else:
-            raw_shorts = [_short(e['path']) for e in saved_files]
-            tally = {}
-            for n in raw_shorts:
-                tally[n] = tally.get(n, 0) + 1
-            seen = {}
-            unique_shorts = []
-            for n in raw_shorts:
-                if tally[n] > 1:
-                    idx = seen.get(n, 1)
-                    unique_shorts.append(f"{n}-{idx}")
-                    seen[n] = idx + 1
-                else:
-                    unique_shorts.append(n)
+            unique_shorts = _unique_names([_short(e['path']) for e in saved_files])
 
         for i, entry in enumerate(saved_files):
             fp, df, run_secs = entry['path'], entry['df'], entry['run_secs']
             short = unique_shorts[i]
+            stats = _report_stats(df, run_secs)
             results_tab = 'Results' if single else _tab(short, 'Results')
-            _write_results_tab(wb.add_worksheet(results_tab), df, run_secs)
+            _write_results_tab(wb.add_worksheet(results_tab), df, run_secs, stats)
 
             if per_client or per_endpoint:
                 detail_tab = 'Detail' if single else _tab(short, 'Detail')
-                _write_detail_tab(wb.add_worksheet(detail_tab), df, run_secs)
+                _write_detail_tab(wb.add_worksheet(detail_tab), stats)
 
         if cons_df is not None and not cons_df.is_empty():
-            _write_results_tab(wb.add_worksheet('Consolidated'), cons_df, cons_secs)
+            stats = _report_stats(cons_df, cons_secs)
+            _write_results_tab(wb.add_worksheet('Consolidated'), cons_df, cons_secs, stats)
             if per_client or per_endpoint:
-                _write_detail_tab(wb.add_worksheet('Consol-Detail'), cons_df, cons_secs)
+                _write_detail_tab(wb.add_worksheet('Consol-Detail'), stats)
 
         wb.close()
         print(f"\nExcel file written: {excel_path}")
@@ -479,58 +537,86 @@ def write_polarwarp_excel(excel_path, saved_files, per_client, per_endpoint,
         print(f"Warning: Failed to write Excel file '{excel_path}': {e}", file=sys.stderr)
 
 
-def compute_summary_rows(df, run_time_secs):
+def summary_stats_plan(df):
+    """Return the lazy per-category (META, GET, PUT) aggregation behind the summary rows."""
+    has_thread = "thread" in df.lazy().collect_schema().names()
+
+    # One grouped pass over all three categories.  Each category's own start/end range and
+    # thread count are aggregated alongside the latency stats instead of re-filtering per category.
+    agg_exprs = [
+        *LATENCY_AGG_EXPRS,
+        MAX_LAT_AGG_EXPR,
+        AVG_OBJ_AGG_EXPR,
+        pl.len().alias("count"),
+        pl.col("bytes").cast(pl.UInt64).sum().cast(pl.Float64).alias("bytes_sum"),
+        pl.col("start").min().alias("min_start"),
+        pl.col("end").max().alias("max_end"),
+    ]
+    if has_thread:
+        agg_exprs.append(pl.col("thread").drop_nulls().n_unique().alias("max_threads"))
+    return (
+        df.lazy()
+        .drop_nulls("category")
+        .group_by("category")
+        .agg(agg_exprs)
+    )
+
+
+def op_run_times(stats, run_time_secs):
+    """
+    Return dict op_name -> effective run time (seconds) for throughput, from the per-category
+    start/end range in a collected summary_stats_plan.  Categories without data, or spanning
+    under a millisecond, fall back to the whole-file run time.
+    """
+    cat_time = {cat: run_time_secs for cat in SUMMARY_CATEGORIES}
+    for cat, min_start, max_end in stats.select("category", "min_start", "max_end").iter_rows():
+        if min_start is not None and max_end is not None:
+            dt = (max_end - min_start).total_seconds()
+            if dt > 0.001:
+                cat_time[cat] = dt
+    op_time_map = {op: cat_time["META"] for op in META_OPS}
+    op_time_map["GET"] = cat_time["GET"]
+    op_time_map["PUT"] = cat_time["PUT"]
+    return op_time_map
+
+
+def compute_summary_rows(df, run_time_secs, stats=None):
     """
     Compute summary rows for operation categories (META, GET, PUT).
-    Returns a list of summary row dictionaries with statistically valid percentiles.
+    Returns a Polars DataFrame of summary rows (in RESULT_COLUMN_ORDER) with statistically
+    valid percentiles, or None when no category has data.
     Uses per-operation time ranges for correct throughput on non-overlapping workloads (issue #14).
     Includes concurrency (distinct thread count) in each row (issue #16).
+    stats may carry an already-collected summary_stats_plan(df), e.g. from a collect_all batch.
     """
     summary_rows = []
 
-    has_thread = "thread" in df.columns
-
-    # Define operation categories: (category_name, operations_list, bucket_idx)
-    categories = [
-        ("META", META_OPS, 97),
-        ("GET", ["GET"], 98),
-        ("PUT", ["PUT"], 99),
-    ]
-
-    for category_name, ops_list, bucket_idx in categories:
-        # Filter to just this category
-        category_df = df.filter(pl.col("op").is_in(ops_list))
+    if stats is None:
+        stats = summary_stats_plan(df).collect()
+    by_category = {row.pop("category"): row for row in stats.iter_rows(named=True)}
 
-        if category_df.height == 0:
+    for category_name, bucket_idx in SUMMARY_CATEGORIES.items():
+        stats_row = by_category.get(category_name)
+        if stats_row is None:
             continue
 
         # Compute per-op time range (issue #14: correct for non-overlapping workloads)
-        min_start = category_df.select(pl.col("start").min()).item()
-        max_end   = category_df.select(pl.col("end").max()).item()
+        min_start, max_end = stats_row.pop("min_start"), stats_row.pop("max_end")
         if min_start is not None and max_end is not None:
             op_time = (max_end - min_start).total_seconds()
             op_time = op_time if op_time > 0.001 else run_time_secs
         else:
             op_time = run_time_secs
 
+        bytes_sum = stats_row.pop("bytes_sum")
+        count = stats_row.pop("count")
         # Concurrency: distinct thread IDs for this op category (issue #16)
-        n_threads = int(category_df.select(pl.col("thread").n_unique()).item()) if has_thread else 0
-
-        # Compute statistically valid percentiles on ALL raw data for this category
-        stats = category_df.select([
-            (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-            (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-            (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-            (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-            (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-            (pl.col("duration_ns").max() / 1000).alias("max_lat_us"),
-            (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-            (pl.count("op").cast(pl.Float64) / op_time).alias("ops_/_sec"),
-            ((pl.col("bytes").sum().cast(pl.Float64) / (1024 * 1024)) / op_time).alias("xput_MBps"),
-            pl.count("op").alias("count"),
-        ])
-
-        row = stats.row(0, named=True)
+        n_threads = stats_row.pop("max_threads", 0)
+
+        row = stats_row
+        row["ops_/_sec"] = count / op_time
+        row["xput_MBps"] = (bytes_sum / (1024 * 1024)) / op_time
+        row["count"] = count
         row["op"] = category_name
         row["bytes_bucket"] = "ALL"
         row["bucket_#"] = bucket_idx
@@ -538,139 +624,142 @@ def compute_summary_rows(df, run_time_secs):
         row["runtime_s"] = round(op_time, 1)
         summary_rows.append(row)
 
-    return summary_rows
+    # At most three rows, so they are finished in Python (keeping Python's round() for
+    # runtime_s) and turned into one frame here rather than by every caller
+    return pl.DataFrame(summary_rows).select(RESULT_COLUMN_ORDER) if summary_rows else None
 
 
-def print_summary_rows(summary_rows, columns_to_format):
-    """Print summary rows with formatting."""
-    import pandas as pd
-    
-    if not summary_rows:
+def print_summary_rows(summary_df, columns_to_format):
+    """Print the summary rows from compute_summary_rows with formatting."""
+    if summary_df is None:
         return
     
     print()  # Separator line
     
-    summary_df = pd.DataFrame(summary_rows)
-    # Reorder columns to match main output
-    column_order = ["op", "bytes_bucket", "bucket_#", "mean_lat_us", "med._lat_us",
-                    "90%_lat_us", "95%_lat_us", "99%_lat_us", "max_lat_us",
-                    "avg_obj_KB", "ops_/_sec", "xput_MBps", "count", "max_threads", "runtime_s"]
-    summary_df = summary_df[[c for c in column_order if c in summary_df.columns]]
-    
-    for column in columns_to_format:
-        if column in summary_df:
-            summary_df[column] = summary_df[column].map(format_with_commas)
-    
     # Print without index, matching main output style
-    print(summary_df.to_string(index=False))
+    print(format_table(summary_df, columns_to_format))
 
 
 #######
 
-script_name = sys.argv[0]
-
-def print_usage():
-    """Print usage information."""
-    print(f"Usage: python {script_name} [OPTIONS] <file1> [file2 ...]")
-    print(f"\nOptions:")
-    print(f"  --skip=<time>  Skip specified time from start of each file")
-    print(f"                 Format: <number>s (seconds) or <number>m (minutes)")
-    print(f"                 Example: --skip=90s or --skip=5m")
-    print(f"  --per-client   Generate per-client statistics (in addition to overall stats)")
-    print(f"  --per-endpoint Generate per-endpoint statistics (in addition to overall stats)")
-    print(f"  --excel[=FILE] Export results to Excel file (default name derived from input file)")
-    print(f"  --help         Show this help message and exit")
-    print(f"\nArguments:")
-    print(f"  file1 file2... One or more oplog files to process (TSV/CSV, optionally .zst compressed)")
+SKIP_UNITS = {"s": "seconds", "m": "minutes"}
+
+def _parse_skip(value):
+    """Parse a --skip value such as "90s" or "5m" into a timedelta."""
+    # A unit suffix on a run of decimal digits; a plain slice and str checks, no regex needed
+    number, unit = value[:-1], value[-1:]
+    if unit not in SKIP_UNITS or not number.isdecimal():
+        raise argparse.ArgumentTypeError(f"invalid skip value '{value}' (expected <number>s or <number>m)")
+    amount = int(number)
+    if amount <= 0:
+        raise argparse.ArgumentTypeError(f"skip value must be positive, got: {amount}")
+    return timedelta(**{SKIP_UNITS[unit]: amount})
+
+def _oplog_file(path):
+    """Validate that an input argument names an existing regular file (one stat call)."""
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise argparse.ArgumentTypeError(f"File not found: {path}")
+    except OSError as e:
+        raise argparse.ArgumentTypeError(f"Cannot access {path}: {e.strerror}")
+    if not stat.S_ISREG(mode):
+        raise argparse.ArgumentTypeError(f"Not a file: {path}")
+    return path
+
+parser = argparse.ArgumentParser(
+    description="Process warp oplog files and report latency, throughput and ops/sec "
+                "grouped by operation type and object size bucket.")
+parser.add_argument("--skip", type=_parse_skip, metavar="TIME",
+                    help="Skip specified time from start of each file, e.g. --skip=90s or --skip=5m")
+parser.add_argument("--per-client", action="store_true",
+                    help="Generate per-client statistics (in addition to overall stats)")
+parser.add_argument("--per-endpoint", action="store_true",
+                    help="Generate per-endpoint statistics (in addition to overall stats)")
+parser.add_argument("--excel", nargs="?", metavar="FILE",
+                    help="Export results to Excel file (default name derived from input file)")
+parser.add_argument("--output-dir", metavar="DIR",
+                    help="Also write each results table to a zstd-compressed Parquet file in DIR")
+parser.add_argument("--cache", action="store_true",
+                    help="Keep a parsed Arrow IPC copy of each text oplog next to it (<file>.polarwarp.arrow) "
+                         "and reuse it while it is newer than the oplog")
+parser.add_argument("--streaming", action="store_true",
+                    help="Bound memory on multi-file runs: read one file ahead and spill each file to a "
+                         "temporary Parquet file for consolidation")
+parser.add_argument("files", nargs="+", type=_oplog_file, metavar="file",
+                    help="One or more oplog files to process (TSV/CSV, optionally .zst compressed, "
+                         "or Parquet/Arrow IPC)")
 
 def print_error(message):
     """Print error message and exit."""
-    print(f"Error: {message}", file=sys.stderr)
-    print(f"Run '{script_name} --help' for usage information.", file=sys.stderr)
-    sys.exit(1)
+    parser.exit(1, f"Error: {message}\nRun '{parser.prog} --help' for usage information.\n")
+
+class OplogError(ValueError):
+    """An input oplog cannot be used.  Raised by the reader threads and reported with print_error
+    by the main loop, so the message appears after that file's "Processing file" header."""
 
 # Check command line args, give basic usage
 if len(sys.argv) < 2:
-    print_usage()
+    parser.print_help()
     sys.exit(1)
 
-# Process --help flag first
-if "--help" in sys.argv or "-h" in sys.argv:
-    print_usage()
-    sys.exit(0)
-
-# Process the --skip argument
-skip_time = None
-per_client_stats = False
-per_endpoint_stats = False
-excel_path = None   # None = no Excel; string = path to write
-file_paths = []
-skip_pattern = re.compile(r"^--skip=(\d+)([sm])$")
-excel_pattern = re.compile(r"^--excel(?:=(.+))?$")
-
-# Now process remaining arguments
-for arg in sys.argv[1:]:
-    if arg.startswith("--"):
-        # This is an option
-        if arg == "--per-client":
-            per_client_stats = True
-            print("Per-client statistics enabled")
-        elif arg == "--per-endpoint":
-            per_endpoint_stats = True
-            print("Per-endpoint statistics enabled")
-        else:
-            excel_m = excel_pattern.match(arg)
-            if excel_m:
-                excel_path = excel_m.group(1)  # may be None if --excel with no value
-                if excel_path is None:
-                    excel_path = ""  # sentinel: derive name later
-                print(f"Excel export enabled" + (f": {excel_path}" if excel_path else ""))
-                continue
-            match = skip_pattern.match(arg)
-            if match:
-                value, unit = match.groups()
-                try:
-                    value = int(value)
-                    if value <= 0:
-                        print_error(f"Skip value must be positive, got: {value}")
-                    if unit == "s":
-                        skip_time = timedelta(seconds=value)
-                    elif unit == "m":
-                        skip_time = timedelta(minutes=value)
-                    print(f"Using skip value of {skip_time}")
-                except ValueError as e:
-                    print_error(f"Invalid skip value: {e}")
-            else:
-                print_error(f"Unknown option: {arg}\nValid options: --skip=<time>, --per-client, --per-endpoint, --excel[=FILE], --help")
-    else:
-        # This is a file path
-        file_paths.append(arg)
-
-if not file_paths:
-    print_error("No input files provided")
+# Like the Rust CLI, --excel only takes a path via "=", so a bare --excel never swallows an input file
+args = parser.parse_intermixed_args(["--excel=" if arg == "--excel" else arg for arg in sys.argv[1:]])
+skip_time = args.skip
+per_client_stats = args.per_client
+per_endpoint_stats = args.per_endpoint
+excel_path = args.excel   # None = no Excel; "" = derive name later; otherwise path to write
+output_dir = args.output_dir
+streaming = args.streaming
+use_cache = args.cache
+file_paths = args.files
 
-# Validate that files exist
-import os
-for file_path in file_paths:
-    if not os.path.exists(file_path):
-        print_error(f"File not found: {file_path}")
-    if not os.path.isfile(file_path):
-        print_error(f"Not a file: {file_path}")
+if per_client_stats:
+    print("Per-client statistics enabled")
+if per_endpoint_stats:
+    print("Per-endpoint statistics enabled")
+if excel_path is not None:
+    print(f"Excel export enabled" + (f": {excel_path}" if excel_path else ""))
+if skip_time is not None:
+    print(f"Using skip value of {skip_time}")
+if output_dir is not None:
+    print(f"Parquet output enabled: {output_dir}")
+if use_cache:
+    print("Parsed oplog cache enabled")
+if streaming:
+    print("Streaming consolidation enabled")
+
+def _oplog_stem(path):
+    """Return the file name of an oplog without its .zst and .csv/.tsv suffixes."""
+    name = os.path.basename(path)
+    name = name.removesuffix('.zst')
+    name = name.removesuffix('.csv') if name.endswith('.csv') else name.removesuffix('.tsv') if name.endswith('.tsv') else name
+    stem, ext = os.path.splitext(name)
+    return stem if ext.lower() in COLUMNAR_SCANNERS else name
 
 # Resolve Excel output path
 def _excel_derive_path(paths):
     if len(paths) == 1:
-        name = os.path.basename(paths[0])
-        name = name.removesuffix('.zst')
-        name = name.removesuffix('.csv') if name.endswith('.csv') else name.removesuffix('.tsv') if name.endswith('.tsv') else name
-        return os.path.join(os.path.dirname(paths[0]) or '.', name + '.xlsx')
+        return os.path.join(os.path.dirname(paths[0]) or '.', _oplog_stem(paths[0]) + '.xlsx')
     return 'polarwarp-results.xlsx'
 
 if excel_path == "":
     excel_path = _excel_derive_path(file_paths)
 
+# Resolve Parquet output names; agents often write identically named oplogs, so number clashes
+parquet_paths = []
+if output_dir is not None:
+    os.makedirs(output_dir, exist_ok=True)
+    # Numbered the same way as the Excel tabs, and never clashing with the consolidated table's file
+    for name in _unique_names([_oplog_stem(p) for p in file_paths], reserved=["polarwarp-consolidated"]):
+        parquet_paths.append(os.path.join(output_dir, name + ".parquet"))
+
+def _write_parquet(df, path):
+    df.write_parquet(path, compression="zstd")
+    print(f"Parquet file written: {path}")
+
 # Per-file data saved for Excel export
-saved_file_dfs = []  # list of dict: {path, df, run_secs}
+saved_file_dfs = []  # list of dict: {path, df (LazyFrame), run_secs}
 
 # Multi-file consolidation overlap thresholds (Jaccard = overlap / union).
 # Below MIN  -> files are sequential runs, consolidation is skipped.
@@ -682,68 +771,173 @@ OVERLAP_MAX_PCT = 97.0
 # Per-file time ranges collected during the main loop [(path, file_start, file_end)]
 file_ranges = []
 
-# Create empty dataFrame for consolidate results
-consolidated_df = pl.DataFrame()
-consolidated_throughput_df = pl.DataFrame() 
+# Per-file frames to consolidate (lazy), concatenated once after the loop.  With --streaming
+# each file is spilled to Parquet in spill_dir and only its scan is kept here.
+consolidated_dfs = []
+spill_dir = tempfile.TemporaryDirectory(prefix="polarwarp-") if streaming and len(file_paths) > 1 else None
 consolidated_throughputs = []
 
+# Columns this run reports on: client_id and endpoint are only read for --per-client / --per-endpoint
+unused_columns = [c for c, wanted in (("client_id", per_client_stats), ("endpoint", per_endpoint_stats)) if not wanted]
+report_columns = [c for c in REPORT_COLUMNS if c not in unused_columns]
+
+def read_oplog(file_path, columns=report_columns):
+    """Read one oplog file and return (df, first start, last end) with parsed timestamps."""
+    # Build a lazy scan so the CSV parse and timestamp conversion run as one
+    # streaming pipeline, instead of materializing the raw string table first.
+    # glob=False prevents polars from treating brackets in filenames as glob patterns
+    # The scan already memory-maps uncompressed local files and never rechunks, so there is
+    # no memory_map/rechunk knob to set (neither reader accepts memory_map any more).
+    # Columnar files carry their own types, so known columns are cast to the CSV schema instead.
+    try:
+        scan_columnar = COLUMNAR_SCANNERS.get(os.path.splitext(file_path)[1].lower())
+        if scan_columnar is not None:
+            lf = scan_columnar(file_path, glob=False)
+            file_schema = lf.collect_schema()
+            lf = lf.with_columns(pl.col(c).cast(t, strict=False) for c, t in OPLOG_SCHEMA.items()
+                                 if c in file_schema and not file_schema[c].is_temporal())
+        else:
+            lf = pl.scan_csv(file_path, ignore_errors=True, separator='\t', glob=False,
+                             infer_schema=False, schema_overrides=OPLOG_SCHEMA)
+        file_schema = lf.collect_schema()
+        file_columns = file_schema.names()
+    except Exception as e:
+        raise OplogError(f"Failed to read file '{file_path}': {e}") from e
+
+    # Check for required columns; integer start_ns/end_ns columns stand in for the timestamp strings
+    has_epoch_ns = "start_ns" in file_columns and "end_ns" in file_columns
+    required_columns = ["start", "end", "op", "bytes", "duration_ns"]
+    if has_epoch_ns:
+        required_columns = required_columns[2:]
+    missing_columns = [col for col in required_columns if col not in file_columns]
+    if missing_columns:
+        raise OplogError(f"File '{file_path}' is missing required columns: {', '.join(missing_columns)}")
+
+    # Note: parsing the ISO 8601 time is a bit tricky.  sai3-bench / warp write a literal capital "Z",
+    # other tools a numeric offset (e.g. "+00:00"); TS_FORMAT handles both and yields UTC.
+    # Epoch nanoseconds need no parsing at all, only a relabel to the same dtype strptime yields.
+    # Columnar files may already store datetimes, which only need normalizing to UTC microseconds.
+    try:
+        has_datetimes = not has_epoch_ns and isinstance(file_schema["start"], pl.Datetime)
+        if has_epoch_ns:
+            ts_exprs = [
+                pl.from_epoch(f"{c}_ns", time_unit="ns").dt.replace_time_zone("UTC").dt.cast_time_unit("us").alias(c)
+                for c in ("start", "end")
+            ]
+        elif has_datetimes:
+            ts_exprs = [
+                (pl.col(c).dt.convert_time_zone("UTC") if file_schema[c].time_zone
+                 else pl.col(c).dt.replace_time_zone("UTC")).dt.cast_time_unit("us").alias(c)
+                for c in ("start", "end")
+            ]
+        else:
+            ts_exprs = [
+                pl.col(c).str.strptime(pl.Datetime, TS_FORMAT, strict=False).alias(c)
+                for c in ("start", "end")
+            ]
+        # Only keep the columns the reports use, so the scan skips decoding the rest
+        keep = [c for c in columns if c in file_columns or c in ("start", "end")]
+        df = lf.with_columns(ts_exprs).select(keep).collect(engine="streaming")
+    except Exception as e:
+        raise OplogError(f"Failed to parse timestamps in file '{file_path}': {e}") from e
+
+    # Check if dataframe is empty
+    if df.is_empty():
+        raise OplogError(f"File '{file_path}' contains no data")
+
+    # First non-null start and last non-null end, reduced in one vectorized select.  ignore_nulls
+    # stops at the first valid value instead of building a null-free copy of each column.
+    start_time, end_time, max_duration, max_bytes = df.select([
+        pl.col("start").first(ignore_nulls=True).alias("s"),
+        pl.col("end").last(ignore_nulls=True).alias("e"),
+        pl.col("duration_ns").max().alias("d"),
+        pl.col("bytes").max().alias("b"),
+    ]).row(0)
+
+    # Latencies under ~4.29 s and objects under 4 GiB fit in UInt32, which halves the bytes every
+    # aggregation (and the consolidation concat) moves.  Files with larger values keep UInt64.
+    # A UInt32 sum would wrap, so byte totals are always widened to UInt64 inside the sum.
+    narrow = [c for c, m in (("duration_ns", max_duration), ("bytes", max_bytes)) if m is not None and m <= 0xFFFFFFFF]
+    if narrow:
+        df = df.with_columns(pl.col(narrow).cast(pl.UInt32))
+
+    # If this error is raised, likely a time parsing issue
+    if start_time is None or end_time is None:
+        raise OplogError(f"Could not determine start/end time in file '{file_path}'. Check timestamp format (ISO 8601 expected)")
+
+    return df, start_time, end_time
+
+def _write_oplog_cache(df, cache_path):
+    """Write df to cache_path as uncompressed IPC.  The frame goes to a temporary file in the same
+    directory that is renamed into place, so a failed or interrupted write never leaves a partial
+    cache that looks newer than its oplog."""
+    # Unique per process and reader thread, and created by write_ipc itself so the usual umask applies
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        df.write_ipc(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+    except (OSError, pl.exceptions.PolarsError) as e:
+        print(f"Warning: could not write oplog cache '{cache_path}': {e}", file=sys.stderr)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def load_oplog(file_path):
+    """Read one oplog, apply the --skip filter and assign size buckets; returns (df, start, end)."""
+    # With --cache, text oplogs are parsed once into an uncompressed (memory-mappable) IPC file
+    # holding the pre-skip frame, so any later --skip or report option can reuse it.
+    cache_path = None
+    if use_cache and os.path.splitext(file_path)[1].lower() not in COLUMNAR_SCANNERS:
+        cache_path = file_path + ".polarwarp.arrow"
+    df = None
+    if cache_path is not None and os.path.isfile(cache_path) and \
+            os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        try:
+            df, start_time, end_time = read_oplog(cache_path)
+        except OplogError as e:
+            # A damaged cache is not fatal: parse the oplog again and replace the cache
+            print(f"Warning: ignoring unreadable oplog cache '{cache_path}': {e}", file=sys.stderr)
+    if df is None:
+        # The cache keeps every report column so later runs with other report options can use it
+        df, start_time, end_time = read_oplog(file_path, REPORT_COLUMNS if cache_path else report_columns)
+        if cache_path is not None:
+            _write_oplog_cache(df, cache_path)
+            df = df.drop(unused_columns, strict=False)
+
+    # The skip filter, bucket assignment and op categorisation execute as one fused pass.  Rows without an op are
+    # dropped here, so every stats table can count rows with pl.len() instead of scanning op.
+    plan = df.lazy().filter(pl.col("op").is_not_null())
+    if skip_time is not None:
+        plan = plan.filter(pl.col("start") > start_time + skip_time)
+    df = plan.with_columns(BUCKET_NUM_EXPR, OP_CATEGORY_EXPR).collect(engine="streaming")
+    return df, start_time, end_time
+
+# Start loading every file up front: Polars releases the GIL while parsing, filtering and bucketing,
+# so that work overlaps across files and the per-file reporting below, which still prints in input order.
+# With --streaming only the next file is read ahead, so at most two files are resident.
+read_ahead = 1 if streaming else len(file_paths)
+read_pool = ThreadPoolExecutor(max_workers=min(read_ahead, os.cpu_count() or 1))
+pending_reads = [read_pool.submit(load_oplog, p) for p in file_paths[:read_ahead]]
+
 #
 # Primary loop, process each file
 #
-for file_path in file_paths:
+for file_idx, file_path in enumerate(file_paths):
     try:
         print(f"\nProcessing file: {file_path}")
         process_start = time.time()
-        
-        # Try to read the file with error handling
-        # glob=False prevents polars from treating brackets in filenames as glob patterns
-        try:
-            df = pl.read_csv(file_path, ignore_errors=True, separator='\t', glob=False)
-        except Exception as e:
-            print_error(f"Failed to read file '{file_path}': {e}")
-        
-        # Check if dataframe is empty
-        if df.is_empty():
-            print_error(f"File '{file_path}' contains no data")
-        
-        # Check for required columns
-        required_columns = ["start", "end", "op", "bytes", "duration_ns"]
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            print_error(f"File '{file_path}' is missing required columns: {', '.join(missing_columns)}")
-
-        # Note: parsing the ISO 8601 time is a bit tricky.  If the value ends in a literal capital "Z", then it may cause problems.  
-        try:
-            df = df.with_columns([
-                pl.col("start").str.replace("Z$", "+00:00").str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%S%.f%z", strict=False).alias("start"),
-                pl.col("end").str.replace("Z$", "+00:00").str.strptime(pl.Datetime, "%Y-%m-%dT%H:%M:%S%.f%z", strict=False).alias("end"),
-            ])
-        except Exception as e:
-            print_error(f"Failed to parse timestamps in file '{file_path}': {e}")
-
-        start_time = None
-        start_values_checked = []
-        for value in df.select(pl.col("start").drop_nulls()).to_series():
-            start_values_checked.append(value)
-            if value is not None:
-                start_time = value
-                break
-
-        end_time = None
-        end_values_checked = []
-        for value in reversed(df.select(pl.col("end").drop_nulls()).to_series()):
-            end_values_checked.append(value)
-            if value is not None:
-                end_time = value
-                break
-
-        # If this error is raised, likely a time parsing issue
-        if start_time is None or end_time is None:
-            print_error(f"Could not determine start/end time in file '{file_path}'. Check timestamp format (ISO 8601 expected)")
-    
+        if file_idx + read_ahead < len(file_paths):
+            pending_reads.append(read_pool.submit(load_oplog, file_paths[file_idx + read_ahead]))
+        df, start_time, end_time = pending_reads[file_idx].result()
+        pending_reads[file_idx] = None
     except KeyboardInterrupt:
         print("\n\nInterrupted by user", file=sys.stderr)
+        read_pool.shutdown(wait=False, cancel_futures=True)
         sys.exit(130)
+    except OplogError as e:
+        read_pool.shutdown(wait=False, cancel_futures=True)
+        print_error(str(e))
     except Exception as e:
         print_error(f"Unexpected error processing file '{file_path}': {e}")
 
@@ -754,140 +948,76 @@ for file_path in file_paths:
     file_ranges.append((file_path, file_start, end_time))
 
     if skip_time is not None:
-        threshold_time = start_time + skip_time
-        print(f"Skipping rows with 'start' <= {threshold_time}.")
-        df = df.filter(pl.col("start") > threshold_time)
+        print(f"Skipping rows with 'start' <= {start_time + skip_time}.")
 
     print(f"The file run time in h:mm:ss is {run_time}, time in seconds is: {run_time_secs}")
 
-# Define the bucket order (matching sai3-bench/polarwarp-rs)
-    bucket_order = ["zero", "1B-8KiB", "8KiB-64KiB", "64KiB-512KiB", "512KiB-4MiB", "4MiB-32MiB", "32MiB-256MiB", "256MiB-2GiB", ">2GiB"]
-
-# Size bucket boundaries (matching sai3-bench)
-    BUCKET_8K = 8 * 1024           # 8 KiB
-    BUCKET_64K = 64 * 1024         # 64 KiB
-    BUCKET_512K = 512 * 1024       # 512 KiB
-    BUCKET_4M = 4 * 1024 * 1024    # 4 MiB
-    BUCKET_32M = 32 * 1024 * 1024  # 32 MiB
-    BUCKET_256M = 256 * 1024 * 1024  # 256 MiB
-    BUCKET_2G = 2 * 1024 * 1024 * 1024  # 2 GiB
-
-# Create buckets for byte ranges (matching sai3-bench bucket definitions)
-    df = df.with_columns([
-        pl.when(pl.col("bytes") == 0).then(pl.lit("zero"))
-        .when((pl.col("bytes") >= 1) & (pl.col("bytes") < BUCKET_8K)).then(pl.lit("1B-8KiB"))
-        .when((pl.col("bytes") >= BUCKET_8K) & (pl.col("bytes") < BUCKET_64K)).then(pl.lit("8KiB-64KiB"))
-        .when((pl.col("bytes") >= BUCKET_64K) & (pl.col("bytes") < BUCKET_512K)).then(pl.lit("64KiB-512KiB"))
-        .when((pl.col("bytes") >= BUCKET_512K) & (pl.col("bytes") < BUCKET_4M)).then(pl.lit("512KiB-4MiB"))
-        .when((pl.col("bytes") >= BUCKET_4M) & (pl.col("bytes") < BUCKET_32M)).then(pl.lit("4MiB-32MiB"))
-        .when((pl.col("bytes") >= BUCKET_32M) & (pl.col("bytes") < BUCKET_256M)).then(pl.lit("32MiB-256MiB"))
-        .when((pl.col("bytes") >= BUCKET_256M) & (pl.col("bytes") < BUCKET_2G)).then(pl.lit("256MiB-2GiB"))
-        .otherwise(pl.lit(">2GiB")).alias("bytes_bucket"),
-        pl.when(pl.col("bytes") == 0).then(0)
-        .when((pl.col("bytes") >= 1) & (pl.col("bytes") < BUCKET_8K)).then(1)
-        .when((pl.col("bytes") >= BUCKET_8K) & (pl.col("bytes") < BUCKET_64K)).then(2)
-        .when((pl.col("bytes") >= BUCKET_64K) & (pl.col("bytes") < BUCKET_512K)).then(3)
-        .when((pl.col("bytes") >= BUCKET_512K) & (pl.col("bytes") < BUCKET_4M)).then(4)
-        .when((pl.col("bytes") >= BUCKET_4M) & (pl.col("bytes") < BUCKET_32M)).then(5)
-        .when((pl.col("bytes") >= BUCKET_32M) & (pl.col("bytes") < BUCKET_256M)).then(6)
-        .when((pl.col("bytes") >= BUCKET_256M) & (pl.col("bytes") < BUCKET_2G)).then(7)
-        .otherwise(8).alias("bucket_#")
-    ])
-
-# Pre-compute per-operation time ranges (issue #14: correct for non-overlapping workloads)
-    def _op_time(op_df):
-        if op_df.height == 0:
-            return run_time_secs
-        min_s = op_df.select(pl.col("start").min()).item()
-        max_e = op_df.select(pl.col("end").max()).item()
-        if min_s is None or max_e is None:
-            return run_time_secs
-        dt = (max_e - min_s).total_seconds()
-        return dt if dt > 0.001 else run_time_secs
-
-    _meta_time = _op_time(df.filter(pl.col("op").is_in(META_OPS)))
-    _get_time  = _op_time(df.filter(pl.col("op") == "GET"))
-    _put_time  = _op_time(df.filter(pl.col("op") == "PUT"))
-
-    # Build op -> run_time mapping
-    _op_time_map = {op: _meta_time for op in META_OPS}
-    _op_time_map["GET"] = _get_time
-    _op_time_map["PUT"] = _put_time
-
 # Now group the results by operation type and our bucket sizes
     _agg_exprs = [
-        (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-        (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-        (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-        (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-        (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-        (pl.col("duration_ns").max() / 1000).alias("max_lat_us"),
-        (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-        pl.count("op").alias("count"),
-        pl.col("bytes").sum().alias("bytes_sum"),
+        *LATENCY_AGG_EXPRS,
+        MAX_LAT_AGG_EXPR,
+        AVG_OBJ_AGG_EXPR,
+        pl.len().alias("count"),
+        pl.col("bytes").cast(pl.UInt64).sum().alias("bytes_sum"),
     ]
     if "thread" in df.columns:
-        _agg_exprs.append(pl.col("thread").n_unique().alias("max_threads"))
+        _agg_exprs.append(pl.col("thread").drop_nulls().n_unique().alias("max_threads"))
+
+    # The bucketed stats and the summary aggregation read the same frame, so run them as one batch
+    grouped, summary_stats = pl.collect_all([
+        df.lazy().group_by(["op", "bucket_#"]).agg(_agg_exprs),
+        summary_stats_plan(df),
+    ])
 
-    result = df.group_by(["op", "bytes_bucket", "bucket_#"]).agg(_agg_exprs)
+    # Per-operation run times (issue #14: correct for non-overlapping workloads), read from the
+    # per-category start/end range the summary batch already aggregated
+    _op_time_map = op_run_times(summary_stats, run_time_secs)
 
-    # Compute per-op throughput rates using the correct per-op time range (issue #14)
-    result = result.with_columns(
-        pl.col("op").map_elements(lambda op: _op_time_map.get(op, run_time_secs), return_dtype=pl.Float64).alias("runtime_s")
+    # Throughput metrics for multi-file consolidation come from the same groups, so the file is
+    # only aggregated once.  These use the whole-file run time rather than the per-op ranges.
+    throughput_metrics = grouped.select([
+        "op",
+        "bucket_#",
+        (pl.col("bytes_sum") / (run_time_secs * 1024 * 1024)).alias("xput_MBps"),
+        "count",
+    ])
+
+    # Compute per-op throughput rates using the correct per-op time range (issue #14).  The
+    # post-aggregation steps run as one lazy chain over the grouped frame, so bytes_sum and the
+    # pre-filter rows never materialise as separate intermediates.
+    result_lf = grouped.lazy().with_columns(
+        BUCKET_LABEL_EXPR,
+        pl.col("op").replace_strict(_op_time_map, default=run_time_secs, return_dtype=pl.Float64).alias("runtime_s"),
     ).with_columns([
         (pl.col("count").cast(pl.Float64) / pl.col("runtime_s")).alias("ops_/_sec"),
         (pl.col("bytes_sum").cast(pl.Float64) / (1024 * 1024) / pl.col("runtime_s")).alias("xput_MBps"),
     ]).drop(["bytes_sum"])
 
-    # Ensure throughput is in Float64 format for consistency
-    result = result.with_columns(pl.col("xput_MBps").cast(pl.Float64))
-
-    # Calculate throughput metrics for the current file (used in multi-file consolidation)
-    throughput_metrics = df.group_by("op", "bytes_bucket").agg([
-        ((pl.col("bytes").sum() / (1024 * 1024)) / run_time_secs).alias("xput_MBps"),
-        pl.count("op").alias("count"),
-    ])
-
-    # Ensure 'op' column is of type Utf8
-    throughput_metrics = throughput_metrics.with_columns(pl.col("op").cast(pl.Utf8))
-
-    final_result = result.sort(["bucket_#", "op"])
-
     # Filter out rows with zero count (empty buckets or invalid data)
-    final_result = final_result.filter(pl.col("count") > 0)
+    result_lf = result_lf.filter(pl.col("count") > 0).sort(["bucket_#", "op"])
 
     # Reorder columns (runtime_s last)
-    _col_order = ["op", "bytes_bucket", "bucket_#", "mean_lat_us", "med._lat_us",
-                  "90%_lat_us", "95%_lat_us", "99%_lat_us", "max_lat_us",
-                  "avg_obj_KB", "ops_/_sec", "xput_MBps", "count", "max_threads", "runtime_s"]
-    final_result = final_result.select([c for c in _col_order if c in final_result.columns])
-
-    final_result_pd = final_result.to_pandas()
-
-# List of columns to send to the pretty comma-fyer
-    columns_to_format = [
-        "med._lat_us",
-        "90%_lat_us",
-        "95%_lat_us",
-        "99%_lat_us",
-        "mean_lat_us",
-        "max_lat_us",
-        "ops_/_sec",
-        "count",
-        "avg_obj_KB",
-        "xput_MBps",
-    ]
-    for column in columns_to_format:
-        if column in final_result_pd:
-            final_result_pd[column] = final_result_pd[column].map(format_with_commas)
-    if "runtime_s" in final_result_pd:
-        final_result_pd["runtime_s"] = final_result_pd["runtime_s"].map(lambda x: f"{x:.1f}")
+    _present = set(result_lf.collect_schema().names())
+    final_result = result_lf.select([c for c in RESULT_COLUMN_ORDER if c in _present]).collect()
+
+    if output_dir is not None:
+        _write_parquet(final_result, parquet_paths[file_idx])
+
+    if "runtime_s" in final_result.columns:
+        # runtime_s takes one value per op category, so the few lookup values are formatted
+        # instead of calling back into Python for every row
+        final_result = final_result.with_columns(
+            pl.col("op").replace_strict(
+                {op: f"{t:.1f}" for op, t in _op_time_map.items()},
+                default=f"{run_time_secs:.1f}", return_dtype=pl.Utf8,
+            ).alias("runtime_s")
+        )
 
-    print(final_result_pd.to_string(index=False))
+    print(format_table(final_result, STATS_COMMA_COLUMNS))
 
     # Print summary rows for META, GET, PUT (with statistically valid percentiles)
-    summary_rows = compute_summary_rows(df, run_time_secs)
-    print_summary_rows(summary_rows, columns_to_format)
+    summary_df = compute_summary_rows(df, run_time_secs, summary_stats)
+    print_summary_rows(summary_df, STATS_COMMA_COLUMNS)
 
     # Print per-client statistics if requested
     if per_client_stats:
@@ -901,18 +1031,25 @@ for file_path in file_paths:
     process_elapsed = time.time() - process_start
     print(f"\nProcessed in {process_elapsed:.2f} seconds")
 
-    # Save data for Excel export
-    if excel_path is not None:
-        saved_file_dfs.append({'path': file_path, 'df': df, 'run_secs': run_time_secs})
+    if spill_dir is not None:
+        spill_path = os.path.join(spill_dir.name, f"{file_idx}.parquet")
+        df.write_parquet(spill_path, compression="lz4")
+        file_lf = pl.scan_parquet(spill_path)
+    else:
+        file_lf = df.lazy()
+    consolidated_dfs.append(file_lf)
 
-    consolidated_df = pl.concat([consolidated_df, df])
+    # Save data for Excel export.  A spilled file is kept only as its Parquet scan, so the
+    # Excel tabs do not pin every file's frame in memory until the end of the run.
+    if excel_path is not None:
+        saved_file_dfs.append({'path': file_path, 'df': file_lf, 'run_secs': run_time_secs})
 
     # Append the metrics to consolidated_throughputs
-    #consolidated_throughput_df = pl.concat([consolidated_throughput_df, throughput_metrics])
     consolidated_throughputs.append(throughput_metrics)
 
 
 # Done processing each file
+read_pool.shutdown()
 
 # If there was only one file to parse, write Excel if requested, then exit
 if len(file_paths) == 1:
@@ -953,13 +1090,30 @@ if jaccard_pct < OVERLAP_MAX_PCT:
 else:
     print(f"Files are concurrent runs ({jaccard_pct:.1f}% Jaccard).  Consolidating overlap window.")
 
-# Filter consolidated_df to only operations whose start falls within the overlap window.
+# Filter the consolidated frames to only operations whose start falls within the overlap window.
 # This ensures counts and throughput are computed over the same time slice across all files.
-consolidated_df = consolidated_df.filter(
+# diagonal_relaxed lets files that lack an optional column (thread, client_id, endpoint) be combined.
+consolidated_lf = pl.concat(consolidated_dfs, how="diagonal_relaxed", rechunk=False).filter(
     (pl.col("start") >= overlap_start) & (pl.col("start") < overlap_end)
 )
-
-if consolidated_df.is_empty():
+# The per-client, per-endpoint and Excel reports need the overlap window as a frame.  In memory it
+# is then filtered once and shared; otherwise the aggregations below read the concat directly.
+needs_consolidated_df = per_client_stats or per_endpoint_stats or excel_path is not None
+if spill_dir is None and needs_consolidated_df:
+    consolidated_lf = consolidated_lf.collect().lazy()
+
+# The bucketed and summary aggregations run as one batch over the overlap window
+consolidated_stats, consolidated_summary_stats = pl.collect_all([
+    consolidated_lf.group_by(["op", "bucket_#"]).agg([
+        *LATENCY_AGG_EXPRS,
+        AVG_OBJ_AGG_EXPR,
+        pl.len().alias("tot_count"),
+    ]).with_columns(BUCKET_LABEL_EXPR),
+    summary_stats_plan(consolidated_lf),
+], engine="streaming")
+
+# Every row left in the window has an op, so it lands in some (op, bucket_#) group
+if consolidated_stats.is_empty():
     print("No valid data in overlap window to consolidate.")
     sys.exit(1)
 
@@ -967,70 +1121,32 @@ consolidated_run_time = overlap_end - overlap_start
 consolidated_run_secs = overlap_secs
 print(f"The consolidated running time in h:mm:ss is {consolidated_run_time}, time in seconds is: {consolidated_run_secs:.2f}")
 
-# Adjust consolidated_stats to join on both "op" and "bytes_bucket"
-if consolidated_df.is_empty():
-    print("No valid data to consolidate.")
-    sys.exit(1)
 
-consolidated_stats = consolidated_df.group_by(["op", "bytes_bucket", "bucket_#"]).agg([
-    (pl.col("duration_ns").mean() / 1000).alias("mean_lat_us"),
-    (pl.col("duration_ns").median() / 1000).alias("med._lat_us"),
-    (pl.col("duration_ns").quantile(0.90) / 1000).alias("90%_lat_us"),
-    (pl.col("duration_ns").quantile(0.95) / 1000).alias("95%_lat_us"),
-    (pl.col("duration_ns").quantile(0.99) / 1000).alias("99%_lat_us"),
-    (pl.col("bytes").mean() / 1024).alias("avg_obj_KB"),
-    pl.count("op").alias("tot_count"),
+# Combine all throughput metrics into a single DataFrame, grouped by "op" and "bucket_#".
+# Every processed file appended its metrics, so the list is never empty here.
+combined_throughputs = pl.concat(consolidated_throughputs, rechunk=False).group_by(["op", "bucket_#"]).agg([
+    pl.col("xput_MBps").sum().alias("total_xput_MBps"),
+    (pl.col("count").sum() / consolidated_run_secs).alias("tot_ops_/_sec"),
 ])
 
-
-# Combine all throughput metrics into a single DataFrame, grouped by "op" and "bytes_bucket"
-if consolidated_throughputs:
-    combined_throughputs = pl.concat(consolidated_throughputs).group_by(["op", "bytes_bucket"]).agg([
-        pl.col("xput_MBps").sum().alias("total_xput_MBps"),
-        (pl.col("count").sum() / consolidated_run_secs).alias("tot_ops_/_sec"),
-    ])
-else:
-    combined_throughputs = pl.DataFrame({
-        "op": [], "bytes_bucket": [], "total_xput_MBps": [], "tot_ops_/_sec": []
-    })
-
-# Join consolidated throughput metrics on "op" and "bytes_bucket"
-consolidated_stats = consolidated_stats.join(combined_throughputs, on=["op", "bytes_bucket"], how="left")
-consolidated_stats = consolidated_stats.sort(["bucket_#", "op"])
+# Join consolidated throughput metrics on "op" and "bucket_#"
+consolidated_stats = consolidated_stats.join(combined_throughputs, on=["op", "bucket_#"], how="left")
 
 # Ensure all expected columns are present and in the desired order
-desired_column_order = [
-    "op", "bytes_bucket", "bucket_#", "mean_lat_us", "med._lat_us",
-    "90%_lat_us", "95%_lat_us", "99%_lat_us", "avg_obj_KB",
-    "tot_ops_/_sec", "total_xput_MBps", "tot_count",
-]
-
-consolidated_stats = consolidated_stats.select(desired_column_order).sort(["bucket_#", "op"])
-
-# Convert to pandas for final output formatting
-consolidated_stats_pd = consolidated_stats.to_pandas()
-
-columns_to_format = [
-    "mean_lat_us",
-    "med._lat_us",
-    "90%_lat_us",
-    "95%_lat_us",
-    "99%_lat_us",
-    "avg_obj_KB",
-    "tot_ops_/_sec",
-    "total_xput_MBps",
-    "tot_count",
-]
-for column in columns_to_format:
-    if column in consolidated_stats_pd:
-        consolidated_stats_pd[column] = consolidated_stats_pd[column].map(format_with_commas)
+consolidated_stats = consolidated_stats.select(CONSOLIDATED_COLUMN_ORDER).sort(["bucket_#", "op"])
 
 print("Consolidated Results:")
-print(consolidated_stats_pd)
+print(format_table(consolidated_stats, CONSOLIDATED_COMMA_COLUMNS))
+
+if output_dir is not None:
+    _write_parquet(consolidated_stats, os.path.join(output_dir, "polarwarp-consolidated.parquet"))
 
 # Print summary rows for consolidated results (with statistically valid percentiles)
-summary_rows = compute_summary_rows(consolidated_df, consolidated_run_secs)
-print_summary_rows(summary_rows, columns_to_format)
+summary_df = compute_summary_rows(consolidated_lf, consolidated_run_secs, consolidated_summary_stats)
+
+if needs_consolidated_df:
+    consolidated_df = consolidated_lf.collect()
+print_summary_rows(summary_df, CONSOLIDATED_COMMA_COLUMNS)
 
 # Print per-client statistics for consolidated data if requested
 if per_client_stats: